@@ -1,12 +1,20 @@
 import streamlit as st
 import pandas as pd
 import os
+import tempfile
+import time
 import joblib
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
 import plotly.express as px
 from pathlib import Path # Use pathlib for better path management
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet/Arrow IPC exports are only offered when pyarrow is installed
+    pa = pq = None
+
 # --- Configuration & Setup ---
 
 # Set a sensible base directory for the models.
@@ -209,22 +217,24 @@ class WeatherPredictor:
     @st.cache_resource
     def load_model(_self, city):
         """Loads the model and scaler for a given city."""
-        model_file = _self.model_folder / f"{city}_model.pkl"
-        scaler_file = _self.model_folder / f"{city}_scaler.pkl"
-        
-        if not model_file.exists() or not scaler_file.exists():
-            return None, None
-        
         try:
-            model = joblib.load(model_file)
-            scaler = joblib.load(scaler_file)
-            return model, scaler
+            return _self.read_model(city)
         except Exception as e:
             st.error(f"Error loading model or scaler for {city}: {e}")
             return None, None
     
-    def predict(self, model, scaler, date):
-        """Generates a single day's prediction."""
+    def read_model(self, city):
+        """Reads the model and scaler from disk without caching them."""
+        model_file = self.model_folder / f"{city}_model.pkl"
+        scaler_file = self.model_folder / f"{city}_scaler.pkl"
+        
+        if not model_file.exists() or not scaler_file.exists():
+            return None, None
+        
+        return joblib.load(model_file), joblib.load(scaler_file)
+    
+    def predict(self, model, scaler, date, fallback=True):
+        """Generates a single day's prediction. Without fallback, failures raise."""
         X_date = pd.DataFrame({
             'day': [date.day],
             'month': [date.month],
@@ -237,24 +247,48 @@ class WeatherPredictor:
             
             return dict(zip(self.features_to_predict, y_pred[0]))
         except Exception as e:
+            if not fallback:
+                raise
             # Return defaults on failure
             st.warning(f"Prediction failed for date {date}: {e}")
             return dict(zip(self.features_to_predict, [20.0, 70.0, 10.0, 22.0, 0.0, 0.0, 10.0, 50.0]))
     
-    def predict_range(self, model, scaler, start_date, days=14):
+    def predict_range(self, model, scaler, start_date, days=14, fallback=True):
         """Generates predictions for a range of days."""
         predictions = []
         for i in range(days):
             current_date = start_date + timedelta(days=i)
-            pred = self.predict(model, scaler, current_date)
+            pred = self.predict(model, scaler, current_date, fallback=fallback)
             pred['date'] = current_date
             pred['day_name'] = current_date.strftime('%A')
             pred['date_str'] = current_date.strftime('%b %d')
             predictions.append(pred)
         return pd.DataFrame(predictions)
 
+    # Shared across sessions and keyed by (city, date); bounded since the date range moves daily
+    @st.cache_data(show_spinner=False, max_entries=128, ttl=timedelta(days=1))
+    def forecast(_self, city, start_date, days=14):
+        """Cached forecast for a city and start date. Failures raise, so they are never cached."""
+        model, scaler = _self.load_model(city)
+        if model is None:
+            raise FileNotFoundError(f"Model or Scaler file not found for {city}.")
+        return _self.predict_range(model, scaler, start_date, days=days, fallback=False)
+
 # --- Utility Functions ---
 
+# Every condition label -> icon. Also the fixed categories of the exported
+# condition column, so all batches share one dictionary.
+WEATHER_CONDITIONS = {
+    "Heavy Rain": "🌧️",
+    "Rain": "☔",
+    "Overcast": "☁️",
+    "Showers": "🌦️",
+    "Partly Cloudy": "⛅",
+    "Hot & Sunny": "🌞",
+    "Chilly": "🥶",
+    "Clear/Sunny": "☀️",
+}
+
 def get_weather_condition(temp, precipitation, cloud_cover):
     """Determine weather condition based on metrics."""
     temp = round(temp)
@@ -262,21 +296,161 @@ def get_weather_condition(temp, precipitation, cloud_cover):
     cloud_cover = round(cloud_cover)
 
     if precipitation >= 5:
-        return "Heavy Rain", "🌧️"
+        condition = "Heavy Rain"
     elif precipitation > 1:
-        return "Rain", "☔"
+        condition = "Rain"
     elif cloud_cover > 85:
-        return "Overcast", "☁️"
+        condition = "Overcast"
     elif cloud_cover > 40 and precipitation > 0.1:
-        return "Showers", "🌦️"
+        condition = "Showers"
     elif cloud_cover > 40:
-        return "Partly Cloudy", "⛅"
+        condition = "Partly Cloudy"
     elif temp >= 30:
-        return "Hot & Sunny", "🌞"
+        condition = "Hot & Sunny"
     elif temp < 10:
-        return "Chilly", "🥶"
+        condition = "Chilly"
     else:
-        return "Clear/Sunny", "☀️"
+        condition = "Clear/Sunny"
+    return condition, WEATHER_CONDITIONS[condition]
+
+# --- Export Functions ---
+
+# Decimal places kept for exported forecast values
+EXPORT_DECIMALS = 2
+
+# Prepared export files live here; any older than EXPORT_MAX_AGE are swept,
+# which also clears files left behind by finished sessions
+EXPORT_DIR = Path(tempfile.gettempdir()) / "weather_exports"
+EXPORT_MAX_AGE = timedelta(hours=1)
+
+# Format name -> (file extension, mime type)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "JSON Lines": ("jsonl", "application/x-ndjson"),
+}
+if pa is not None:
+    EXPORT_FORMATS["Parquet"] = ("parquet", "application/vnd.apache.parquet")
+    EXPORT_FORMATS["Arrow IPC"] = ("arrow", "application/vnd.apache.arrow.file")
+
+
+def to_export_frame(predictions_df, city, cities, features):
+    """Compact export schema: float32 features, categorical city and condition."""
+    # Classify from the unrounded values so labels match what the page shows
+    conditions = [
+        get_weather_condition(temp, precip, cloud)[0]
+        for temp, precip, cloud in zip(
+            predictions_df['temperature_2m'],
+            predictions_df['precipitation'],
+            predictions_df['cloud_cover']
+        )
+    ]
+    frame = predictions_df[['date']].copy()
+    frame[features] = predictions_df[features].round(EXPORT_DECIMALS).astype('float32')
+    frame.insert(0, 'city', pd.Categorical([city] * len(frame), categories=cities))
+    frame['condition'] = pd.Categorical(conditions, categories=list(WEATHER_CONDITIONS))
+    return frame
+
+
+def iter_city_forecasts(predictor, cities, start_date, days=14):
+    """Yield each city's export frame in turn, so only one model and batch are held in memory."""
+    for city in cities:
+        # Uncached load: an archive must not pin every city's model in the resource cache
+        try:
+            model, scaler = predictor.read_model(city)
+        except Exception as e:
+            st.warning(f"Skipping {city} in export: {e}")
+            continue
+        if model is None:
+            continue
+        predictions_df = predictor.predict_range(model, scaler, start_date, days=days)
+        del model, scaler
+        yield to_export_frame(predictions_df, city, cities, predictor.features_to_predict)
+
+
+def write_forecasts(frames, fmt, sink):
+    """Stream forecast frames into a binary sink, one batch at a time."""
+    if fmt in ("Parquet", "Arrow IPC"):
+        writer, schema = None, None
+        try:
+            for frame in frames:
+                table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+                if writer is None:
+                    schema = table.schema
+                    if fmt == "Parquet":
+                        writer = pq.ParquetWriter(sink, schema)
+                    else:
+                        writer = pa.ipc.new_file(sink, schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return
+
+    header = True
+    for frame in frames:
+        if fmt == "CSV":
+            chunk = frame.to_csv(index=False, header=header)
+        else:
+            # float32 is upcast for JSON, so cap the digits to avoid float noise
+            chunk = frame.to_json(
+                orient='records', lines=True, date_format='iso',
+                double_precision=EXPORT_DECIMALS
+            )
+            if not chunk.endswith('\n'):
+                chunk += '\n'
+        sink.write(chunk.encode('utf-8'))
+        header = False
+
+
+def remove_export_file(path):
+    """Delete a prepared export file, ignoring one that is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def sweep_export_files(max_age=EXPORT_MAX_AGE):
+    """Delete prepared export files older than max_age."""
+    if not EXPORT_DIR.exists():
+        return
+    cutoff = time.time() - max_age.total_seconds()
+    for path in EXPORT_DIR.iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            continue  # Removed concurrently by another session
+
+
+def prepare_export_file(predictor, fmt, scope, city, date):
+    """Write the requested export to a temporary file and return its path, or None if empty."""
+    cities = predictor.get_available_cities()
+    extension, _ = EXPORT_FORMATS[fmt]
+    if scope == "All cities":
+        frames = iter_city_forecasts(predictor, cities, date)
+    else:
+        frames = [to_export_frame(
+            predictor.forecast(city, date, days=14), city, cities, predictor.features_to_predict
+        )]
+    
+    sweep_export_files()
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Write to disk rather than an in-memory buffer so the archive is never held twice
+    with tempfile.NamedTemporaryFile(dir=EXPORT_DIR, suffix=f".{extension}", delete=False) as sink:
+        export_path = sink.name
+        try:
+            write_forecasts(frames, fmt, sink)
+        except Exception:
+            sink.close()
+            remove_export_file(export_path)
+            raise
+    
+    if os.path.getsize(export_path) == 0:
+        remove_export_file(export_path)
+        return None
+    return export_path
 
 # --- Rendering Functions ---
 
@@ -373,109 +547,264 @@ def render_daily_forecast(predictions_df):
             
         st.markdown('<hr style="margin: 0;">', unsafe_allow_html=True)
 
-# THE MISSING FUNCTION DEFINITION IS ADDED HERE
-def render_weather_charts(predictions_df):
-    """Render interactive weather charts."""
+
+def build_chart_data(predictions_df):
+    """Serialize the forecast columns used by the charts into plain lists."""
+    return {
+        'date': predictions_df['date'].dt.strftime('%Y-%m-%d').tolist(),
+        'temperature_2m': predictions_df['temperature_2m'].round(1).tolist(),
+        'apparent_temperature': predictions_df['apparent_temperature'].round(1).tolist(),
+        'precipitation': predictions_df['precipitation'].round(1).tolist(),
+        'wind_speed_10m': predictions_df['wind_speed_10m'].round(1).tolist(),
+        'relative_humidity_2m': predictions_df['relative_humidity_2m'].round(1).tolist(),
+    }
+
+
+def build_temperature_figure(chart_data):
+    """Temperature and feels-like trend."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=chart_data['date'],
+        y=chart_data['temperature_2m'],
+        mode='lines+markers',
+        name='Temperature',
+        line=dict(color='#FF6B6B', width=3),
+        marker=dict(size=8),
+        fill='tozeroy',
+        fillcolor='rgba(255, 107, 107, 0.1)'
+    ))
+    fig.add_trace(go.Scatter(
+        x=chart_data['date'],
+        y=chart_data['apparent_temperature'],
+        mode='lines+markers',
+        name='Feels Like',
+        line=dict(color='#FFA07A', width=2, dash='dash'),
+        marker=dict(size=6)
+    ))
+    fig.update_layout(
+        title="Temperature Forecast",
+        xaxis_title="Date",
+        yaxis_title="Temperature (°C)",
+        hovermode='x unified',
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial, sans-serif", size=12, color='black')
+    )
+    return fig
+
+
+def build_precipitation_figure(chart_data):
+    """Daily precipitation bars."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=chart_data['date'],
+        y=chart_data['precipitation'],
+        name='Precipitation',
+        marker_color='#4A90E2'
+    ))
+    fig.update_layout(
+        title="Precipitation Forecast",
+        xaxis_title="Date",
+        yaxis_title="Precipitation (mm)",
+        hovermode='x unified',
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial, sans-serif", size=12, color='black')
+    )
+    return fig
+
+
+def build_wind_humidity_figure(chart_data):
+    """Wind speed and humidity on twin axes."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=chart_data['date'],
+        y=chart_data['wind_speed_10m'],
+        mode='lines+markers',
+        name='Wind Speed',
+        line=dict(color='#50C878', width=3),
+        marker=dict(size=8),
+        yaxis='y'
+    ))
+    fig.add_trace(go.Scatter(
+        x=chart_data['date'],
+        y=chart_data['relative_humidity_2m'],
+        mode='lines+markers',
+        name='Humidity',
+        line=dict(color='#87CEEB', width=3),
+        marker=dict(size=8),
+        yaxis='y2'
+    ))
+    fig.update_layout(
+        title="Wind Speed & Humidity",
+        xaxis_title="Date",
+        yaxis=dict(
+            title="Wind Speed (km/h)",
+            title_font=dict(color='#50C878')
+        ),
+        yaxis2=dict(
+            title="Humidity (%)",
+            overlaying='y',
+            side='right',
+            title_font=dict(color='#87CEEB')
+        ),
+        hovermode='x unified',
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial, sans-serif", size=12, color='black')
+    )
+    return fig
+
+
+# Chart tabs, each built only when selected
+CHART_TABS = {
+    "🌡️ Temperature": build_temperature_figure,
+    "🌧️ Precipitation": build_precipitation_figure,
+    "💨 Wind & Humidity": build_wind_humidity_figure,
+}
+
+
+@st.fragment
+def render_weather_charts(chart_data):
+    """Render interactive weather charts. Switching tabs reruns only this fragment."""
     st.markdown("### Weather Trends")
     
-    if predictions_df.empty:
+    if not chart_data['date']:
         st.info("No data available for charts.")
         return
 
-    tab1, tab2, tab3 = st.tabs(["🌡️ Temperature", "🌧️ Precipitation", "💨 Wind & Humidity"])
-    
-    with tab1:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=predictions_df['date'],
-            y=predictions_df['temperature_2m'],
-            mode='lines+markers',
-            name='Temperature',
-            line=dict(color='#FF6B6B', width=3),
-            marker=dict(size=8),
-            fill='tozeroy',
-            fillcolor='rgba(255, 107, 107, 0.1)'
-        ))
-        fig.add_trace(go.Scatter(
-            x=predictions_df['date'],
-            y=predictions_df['apparent_temperature'],
-            mode='lines+markers',
-            name='Feels Like',
-            line=dict(color='#FFA07A', width=2, dash='dash'),
-            marker=dict(size=6)
-        ))
-        fig.update_layout(
-            title="Temperature Forecast",
-            xaxis_title="Date",
-            yaxis_title="Temperature (°C)",
-            hovermode='x unified',
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family="Arial, sans-serif", size=12, color='black')
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=predictions_df['date'],
-            y=predictions_df['precipitation'],
-            name='Precipitation',
-            marker_color='#4A90E2'
-        ))
-        fig.update_layout(
-            title="Precipitation Forecast",
-            xaxis_title="Date",
-            yaxis_title="Precipitation (mm)",
-            hovermode='x unified',
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family="Arial, sans-serif", size=12, color='black')
+    selected_tab = st.radio(
+        "Chart",
+        list(CHART_TABS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="chart_tab"
+    )
+    fig = CHART_TABS[selected_tab](chart_data)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_temperature_overview(chart_data):
+    """Sidebar mini chart, drawn from the series already serialized for the main charts."""
+    st.markdown("**14-Day Temperature Overview**")
+    overview = pd.DataFrame(
+        {'°C': chart_data['temperature_2m']},
+        index=pd.to_datetime(chart_data['date'])
+    )
+    st.area_chart(overview, color='#1a73e8', height=250)
+
+
+@st.fragment
+def render_export(predictor, city, date):
+    """Forecast export controls. Files are serialized only when requested."""
+    fmt_col, scope_col = st.columns(2)
+    with fmt_col:
+        fmt = st.selectbox("Format", list(EXPORT_FORMATS), key="export_format")
+    with scope_col:
+        scope = st.selectbox("Scope", ["This city", "All cities"], key="export_scope")
+    
+    # The prepared file outlives the download click's rerun; one per session,
+    # deleted as soon as the selection no longer matches it
+    export_key = (fmt, scope, city, date)
+    prepared = st.session_state.get('prepared_export')
+    if prepared is not None and prepared['key'] != export_key:
+        remove_export_file(prepared['path'])
+        del st.session_state.prepared_export
+        prepared = None
+    
+    if st.button("📦 Prepare Export", use_container_width=True, key="export_button"):
+        if prepared is not None:
+            remove_export_file(prepared['path'])
+        
+        try:
+            with st.spinner(f'📦 Exporting {scope.lower()} as {fmt}...'):
+                export_path = prepare_export_file(predictor, fmt, scope, city, date)
+        except Exception as e:
+            st.session_state.pop('prepared_export', None)
+            st.error(f"Export failed: {e}")
+            return
+        
+        if export_path is None:
+            st.session_state.pop('prepared_export', None)
+            st.warning("Nothing to export.")
+            return
+        
+        prepared = st.session_state.prepared_export = {'key': export_key, 'path': export_path}
+    
+    if prepared is None or not os.path.exists(prepared['path']):
+        return
+    
+    extension, mime = EXPORT_FORMATS[fmt]
+    file_stem = "all_cities" if scope == "All cities" else city
+    with open(prepared['path'], 'rb') as export_file:
+        st.download_button(
+            label="📥 Download Forecast Data",
+            data=export_file,
+            file_name=f"{file_stem}_forecast_{date.strftime('%Y-%m-%d')}.{extension}",
+            mime=mime,
+            use_container_width=True,
+            key="export_download"
         )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab3:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=predictions_df['date'],
-            y=predictions_df['wind_speed_10m'],
-            mode='lines+markers',
-            name='Wind Speed',
-            line=dict(color='#50C878', width=3),
-            marker=dict(size=8),
-            yaxis='y'
-        ))
-        fig.add_trace(go.Scatter(
-            x=predictions_df['date'],
-            y=predictions_df['relative_humidity_2m'],
-            mode='lines+markers',
-            name='Humidity',
-            line=dict(color='#87CEEB', width=3),
-            marker=dict(size=8),
-            yaxis='y2'
-        ))
-        fig.update_layout(
-            title="Wind Speed & Humidity",
-            xaxis_title="Date",
-            yaxis=dict(
-                title="Wind Speed (km/h)",
-                title_font=dict(color='#50C878')
-            ),
-            yaxis2=dict(
-                title="Humidity (%)",
-                overlaying='y',
-                side='right',
-                title_font=dict(color='#87CEEB')
-            ),
-            hovermode='x unified',
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family="Arial, sans-serif", size=12, color='black')
+
+
+@st.fragment
+def render_forecast(predictor, city):
+    """Everything that depends on the selected date. A date change reruns only this fragment."""
+    date_col, _ = st.columns([2, 4])
+    with date_col:
+        selected_date_raw = st.date_input(
+            "📅 Select date",
+            value=datetime.now().date(),
+            label_visibility="collapsed",
+            key="date_selector",
+            min_value=datetime.now().date()
         )
-        st.plotly_chart(fig, use_container_width=True)
+    selected_date = datetime.combine(selected_date_raw, datetime.min.time())
+
+    try:
+        with st.spinner(f'🌤️ Predicting weather for {city}...'):
+            # Get 14-day forecast (cached per city and date)
+            predictions_df = predictor.forecast(city, selected_date, days=14)
+    except Exception as e:
+        st.error(f"❌ Prediction failed for **{city}**: {e}")
+        return
+        
+    current_prediction = predictions_df.iloc[0].to_dict()
+    chart_data = build_chart_data(predictions_df)
+    
+    # --- Rendering Layout ---
+    
+    col_main, col_side = st.columns([2, 1])
+    
+    with col_main:
+        st.markdown("## Today's Forecast", unsafe_allow_html=True)
+        render_current_weather(city, current_prediction, selected_date)
+        
+        render_daily_forecast(predictions_df)
+    
+    with col_side:
+        st.markdown("## Global Stats", unsafe_allow_html=True)
+        
+        # Quick stats
+        max_temp = predictions_df['temperature_2m'].max()
+        min_temp = predictions_df['temperature_2m'].min()
+        avg_temp = predictions_df['temperature_2m'].mean()
+        
+        st.metric("Average Temperature (14d)", f"{avg_temp:.1f}°C", f"{max_temp-min_temp:.1f}°C range")
+        st.metric("Total Precipitation (14d)", f"{predictions_df['precipitation'].sum():.1f} mm")
+        st.metric("Max Wind Speed (14d)", f"{predictions_df['wind_speed_10m'].max():.1f} km/h")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        render_temperature_overview(chart_data)
+        render_export(predictor, city, selected_date)
+    
+    # Detailed charts section
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    render_weather_charts(chart_data)
 
 
 # --- Main Application Logic ---
@@ -489,11 +818,12 @@ def main():
     # Initialize predictor using st.session_state
     if 'predictor' not in st.session_state:
         st.session_state.predictor = WeatherPredictor(MODEL_FOLDER)
+    predictor = st.session_state.predictor
     
     # Top navigation bar
-    col1, col2, col3 = st.columns([3, 2, 1])
+    col1, col2 = st.columns([5, 1])
     
-    cities = st.session_state.predictor.get_available_cities()
+    cities = predictor.get_available_cities()
     
     with col1:
         if not cities:
@@ -506,18 +836,8 @@ def main():
             label_visibility="collapsed",
             key="city_selector"
         )
-    
-    with col2:
-        selected_date_raw = st.date_input(
-            "📅 Select date",
-            value=datetime.now().date(),
-            label_visibility="collapsed",
-            key="date_selector",
-            min_value=datetime.now().date()
-        )
-        selected_date = datetime.combine(selected_date_raw, datetime.min.time())
 
-    with col3:
+    with col2:
         if st.button("🔄 Refresh", use_container_width=True, key="refresh_button"):
             st.cache_data.clear()
             st.cache_resource.clear()
@@ -533,86 +853,15 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Load model and make predictions
-    model, scaler = None, None
-    with st.spinner(f'🌤️ Loading and predicting weather for {selected_city}...'):
-        model, scaler = st.session_state.predictor.load_model(selected_city)
+    # Load model once per city; forecast-dependent sections live in the fragment
+    with st.spinner(f'🌤️ Loading model for {selected_city}...'):
+        model, scaler = predictor.load_model(selected_city)
         
-        if model is None:
-            st.error(f"❌ Model or Scaler file not found for **{selected_city}**.")
-            st.stop()
-        
-        # Get 14-day forecast
-        predictions_df = st.session_state.predictor.predict_range(model, scaler, selected_date, days=14)
-        
-        if predictions_df.empty:
-            st.error("Prediction failed. Dataframe is empty.")
-            st.stop()
-            
-        current_prediction = predictions_df.iloc[0].to_dict()
-    
-    # --- Rendering Layout ---
-    
-    col_main, col_side = st.columns([2, 1])
-    
-    with col_main:
-        st.markdown("## Today's Forecast", unsafe_allow_html=True)
-        render_current_weather(selected_city, current_prediction, selected_date)
-        
-
-        
-        render_daily_forecast(predictions_df)
-    
-    with col_side:
-        st.markdown("## Global Stats", unsafe_allow_html=True)
-        
-        # Quick stats
-        max_temp = predictions_df['temperature_2m'].max()
-        min_temp = predictions_df['temperature_2m'].min()
-        avg_temp = predictions_df['temperature_2m'].mean()
-        
-        st.metric("Average Temperature (14d)", f"{avg_temp:.1f}°C", f"{max_temp-min_temp:.1f}°C range")
-        st.metric("Total Precipitation (14d)", f"{predictions_df['precipitation'].sum():.1f} mm")
-        st.metric("Max Wind Speed (14d)", f"{predictions_df['wind_speed_10m'].max():.1f} km/h")
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Mini chart
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=predictions_df['date'],
-            y=predictions_df['temperature_2m'],
-            mode='lines',
-            line=dict(color='#1a73e8', width=2),
-            fill='tozeroy',
-            fillcolor='rgba(26, 115, 232, 0.1)'
-        ))
-        fig.update_layout(
-            title="14-Day Temperature Overview",
-            xaxis_title="",
-            yaxis_title="°C",
-            height=250,
-            margin=dict(l=10, r=10, t=40, b=10),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='black'),
-            showlegend=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Download button
-        csv = predictions_df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download Forecast Data",
-            data=csv,
-            file_name=f"{selected_city}_forecast_{selected_date.strftime('%Y-%m-%d')}.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
+    if model is None:
+        st.error(f"❌ Model or Scaler file not found for **{selected_city}**.")
+        st.stop()
     
-    # Detailed charts section
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    render_weather_charts(predictions_df)
+    render_forecast(predictor, selected_city)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()